@@ -2,20 +2,42 @@
 # AUTHENTICATION ROUTE IMPORTS
 # ===============================
 
+# Runs blocking work (DB queries, password hashing) off the event loop
+import asyncio
+
+# Caches the dummy hash used to keep failed logins constant-time
+from functools import lru_cache
+
 # FastAPI tools for building routes, handling dependencies, and raising errors
 from fastapi import APIRouter, Depends, HTTPException, status
 
 # Provides a standardized way to accept username/password from login forms
 from fastapi.security import OAuth2PasswordRequestForm
 
-# Database session management
-from sqlalchemy.orm import Session
+# Returns the login payload directly, skipping response_model re-validation
+from fastapi.responses import ORJSONResponse
+
+# Database session management; undefer() loads the deferred User.role with
+# the user, set_committed_value() fills it in for a brand-new user
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+
+# 2.0-style statement builders
+from sqlalchemy import func, insert, literal, select, update
+
+# Postgres INSERT, which supports ON CONFLICT for atomic duplicate detection
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 # Data validation and serialization for our token response
 from pydantic import BaseModel
 
 # Security utilities for hashing and JWT creation
-from app.core.security import verify_password, create_access_token
+from app.core.security import (
+    create_access_token,
+    password_needs_rehash,
+    verify_password,
+    verify_password_async,
+)
 
 # Dependency that provides a database session
 from app.db.session import get_db
@@ -23,18 +45,20 @@ from app.db.session import get_db
 # The User model used to query login credentials
 from app.db.models import User
 
-# Import Role model to look up and assign user roles
-from app.db.models import Role
+# Import Role model and the user_roles link table to assign user roles,
+# plus the role a user with no roles assigned has
+from app.db.models import DEFAULT_ROLE, Role, user_roles
 
 # ===============================
 # ADDITIONAL IMPORTS FOR REGISTER
 # ===============================
 
 # Import the user creation schema and read schema for response serialization
-from app.schemas.user import UserCreate, UserRead
+# normalize_email gives the login form the same email form UserCreate stores
+from app.schemas.user import UserCreate, UserRead, normalize_email
 
 # Import your password hashing helper
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash, get_password_hash_async
 
 
 # ===============================
@@ -61,6 +85,23 @@ class TokenResponse(BaseModel):
 # It keeps authentication endpoints modular and easily imported into main.py.
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+
+# Why a dummy hash exists:
+# When the email is unknown we still run a full password verification against
+# this hash, so a failed login takes the same time whether or not the account
+# exists. Cached so it is hashed only once per process, then just verified.
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    return get_password_hash("invalid-placeholder-password")
+
+
+# Why the dummy verify is one function:
+# The first call builds the dummy hash (a full argon2 hash). Running lookup and
+# verify together on a worker thread keeps that off the event loop too.
+def _verify_dummy_password(plain_password: str) -> None:
+    verify_password(plain_password, _dummy_hash())
+
+
 # ===============================
 # LOGIN ROUTE
 # ===============================
@@ -68,20 +109,52 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 
 # Why this endpoint exists:
 # It verifies user credentials and returns a signed JWT access token if valid.
-@router.post("/login", response_model=TokenResponse, status_code=status.HTTP_200_OK)
-def login(
+#
+# Why it is async:
+# Password verification is deliberately slow CPU work. Running it (and the
+# blocking DB calls) through asyncio.to_thread keeps the event loop free to
+# serve other requests while a hash is being checked.
+#
+# Why response_model=None:
+# The handler returns a ready-made ORJSONResponse, so FastAPI has nothing to
+# re-validate; responses= still documents TokenResponse in Swagger.
+@router.post(
+    "/login",
+    response_model=None,
+    responses={200: {"model": TokenResponse}},
+    status_code=status.HTTP_200_OK,
+)
+async def login(
     # Why we use Depends() with OAuth2PasswordRequestForm:
     # It automatically extracts "username" and "password" from form data.
     form_data: OAuth2PasswordRequestForm = Depends(),
     # Why we use Depends() with get_db:
     # Provides a database session to perform user lookup.
     db: Session = Depends(get_db),
-) -> TokenResponse:
-    # Query the database for the user by email (used as the "username" field)
-    user = db.query(User).filter(User.email == form_data.username).first()
+) -> ORJSONResponse:
+    # Query the database for the user by email (used as the "username" field).
+    # The login form isn't a UserCreate, so normalize with the same helper; the
+    # LOWER(email) comparison is served by the ix_users_email_lower index.
+    # The deferred User.role is loaded in the same SELECT for the token.
+    email = normalize_email(form_data.username)
+    user = await asyncio.to_thread(
+        db.query(User)
+        .options(undefer(User.role))
+        .filter(func.lower(User.email) == email)
+        .first
+    )
 
-    # Security best practice: do not reveal whether the email or password failed
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Security best practice: do not reveal whether the email or password failed.
+    # Unknown emails still pay for a password verify so response times match.
+    if user is None:
+        await asyncio.to_thread(_verify_dummy_password, form_data.password)
+        password_ok = False
+    else:
+        password_ok = await verify_password_async(
+            form_data.password, user.hashed_password
+        )
+
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -92,12 +165,33 @@ def login(
     # and the role (admin, staff, etc.) for role-based access control.
     access_token = create_access_token(
         subject=user.email,
-        role=str(user.role),  # NEW: embed role into JWT payload
+        # User.role is derived from the user's roles by a subquery undeferred
+        # in the login SELECT itself, so it goes into the token as-is.
+        role=user.role,
         expires_delta=None,  # uses default expiry from settings
     )
 
-    # Return the signed JWT and token type
-    return TokenResponse(access_token=access_token, token_type="bearer")
+    # Why the stored hash may be replaced here:
+    # Legacy bcrypt hashes (and argon2 hashes from older cost settings) are
+    # re-hashed with the current argon2id parameters while the plaintext is at
+    # hand. Otherwise those accounts would pay bcrypt's much slower verify on
+    # every login, and that timing gap against the dummy-hash path would
+    # reveal which emails exist.
+    if password_needs_rehash(user.hashed_password):
+        new_hash = await get_password_hash_async(form_data.password)
+
+        def _upgrade_hash() -> None:
+            db.execute(
+                update(User)
+                .where(User.id == user.id)
+                .values(hashed_password=new_hash)
+            )
+            db.commit()
+
+        await asyncio.to_thread(_upgrade_hash)
+
+    # Return the signed JWT and token type (same shape as TokenResponse)
+    return ORJSONResponse({"access_token": access_token, "token_type": "bearer"})
 
 
 # ===============================
@@ -108,8 +202,9 @@ def login(
 # Why this endpoint exists:
 # It allows new users to register by providing their email and password.
 # The password is securely hashed before being saved in the database.
+# Like login, it is async and pushes blocking work onto worker threads.
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def register_user(
+async def register_user(
     # Why we accept a UserCreate model:
     # It validates incoming data and ensures required fields (email, password) are present.
     user_in: UserCreate,
@@ -117,43 +212,72 @@ def register_user(
     # Needed to insert the new user record and check for duplicates.
     db: Session = Depends(get_db),
 ):
-    # Why we check for duplicates first:
-    # Prevents two accounts from registering with the same email address.
-    existing_user = db.query(User).filter(User.email == user_in.email).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="A user with this email already exists.",
-        )
-
     # Why we hash the password:
-    # Plaintext passwords are never stored — only bcrypt hashes.
-    hashed_password = get_password_hash(user_in.password)
-
-    # Why we create a new User object:
-    # Maps validated Pydantic data to our SQLAlchemy model for insertion.
-    new_user = User(
-        email=user_in.email,
-        full_name=user_in.full_name,
-        hashed_password=hashed_password,
+    # Plaintext passwords are never stored — only argon2id hashes.
+    hashed_password = await get_password_hash_async(user_in.password)
+
+    # Why we insert with ON CONFLICT DO NOTHING ... RETURNING:
+    # Maps validated Pydantic data to a row in the users table. If the email is
+    # already registered (in any letter case), the unique indexes on email and
+    # LOWER(email) make Postgres skip the row and
+    # RETURNING yields nothing — the duplicate check and the insert are one
+    # atomic statement, with no race between a SELECT and the INSERT.
+    # Otherwise RETURNING hands back the stored row (generated ID, defaults).
+    user_stmt = (
+        pg_insert(User)
+        .values(
+            email=user_in.email,
+            full_name=user_in.full_name,
+            hashed_password=hashed_password,
+        )
+        .on_conflict_do_nothing()
+        # Why User.role is not returned:
+        # Inside INSERT ... RETURNING its subquery can't correlate to the new
+        # row (see User.role), so it is filled in after roles are linked.
+        .returning(User)
     )
 
-    # If the request includes role IDs, assign those roles to the new user
-    if user_in.role_ids:
-        # Query the Role table for all matching role IDs
-        roles = db.query(Role).filter(Role.id.in_(user_in.role_ids)).all()
-
-        # Assign the found Role objects to the user's relationaship
-        new_user.roles = roles
-
-    # Why we add and commit:
-    # Adds the user to the database and commits the transaction.
-    db.add(new_user)
-    db.commit()
-
-    # Refresh ensures we get the auto-generated ID and timestamps.
-    db.refresh(new_user)
+    # Why everything happens in one worker-thread call:
+    # The user INSERT, role assignment and COMMIT share a single transaction,
+    # and the response is built before commit() expires the loaded object.
+    def _save() -> UserRead:
+        new_user = db.scalars(user_stmt).one_or_none()
+
+        # Why no row means a duplicate:
+        # Prevents two accounts from registering with the same email address.
+        if new_user is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A user with this email already exists.",
+            )
+
+        # If the request includes role IDs, link the roles that actually exist.
+        # INSERT ... SELECT filters and links them in one statement.
+        role_linked = False
+        if user_in.role_ids:
+            linked = db.execute(
+                insert(user_roles).from_select(
+                    ["user_id", "role_id"],
+                    select(literal(new_user.id), Role.id).where(
+                        Role.id.in_(user_in.role_ids)
+                    ),
+                )
+            )
+            role_linked = bool(linked.rowcount)
+
+        # Why the role is only re-read when a link was made:
+        # A user with no roles has the default role, no query needed.
+        if role_linked:
+            db.refresh(new_user, ["role"])
+        else:
+            set_committed_value(new_user, "role", DEFAULT_ROLE)
+
+        created = UserRead.model_validate(new_user)
+        db.commit()
+        return created
+
+    created_user = await asyncio.to_thread(_save)
 
     # Why we return the created user:
     # The response model (UserRead) automatically hides sensitive fields.
-    return new_user
+    return created_user
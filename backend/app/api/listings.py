@@ -13,8 +13,11 @@ from fastapi import APIRouter, HTTPException, status, Response, Depends
 # Import SQLAlchemy Session type for database interactions.
 from sqlalchemy.orm import Session
 
-# Import datetime and timezone so we can set created_at and updated_at correctly in UTC.
-from datetime import datetime, timezone
+# Import select/insert/update and func to build 2.0-style statements.
+from sqlalchemy import select, insert, update, func
+
+# TypeAdapter validates a whole list of listings in a single pydantic-core call.
+from pydantic import TypeAdapter
 
 # Bring in our dependency that provides a database session for each request.
 from app.db.session import get_db
@@ -37,12 +40,45 @@ from app.schemas.listing import (
 # Create a router with a URL prefix (/listings) and a tag (used in Swagger docs).
 router = APIRouter(prefix="/listings", tags=["Listings"])
 
+# Built once at import: validates a page of ORM rows into ListingRead models in
+# one call instead of one model_validate() per row.
+_LISTING_LIST_ADAPTER = TypeAdapter(list[ListingRead])
+
+# Only the columns ListingRead serializes. Selecting columns instead of the
+# Listing entity returns plain rows and skips ORM object hydration.
+_LISTING_READ_COLUMNS = tuple(getattr(Listing, name) for name in ListingRead.model_fields)
+
+# Rows fetched from the database cursor per batch when streaming a page.
+# Only pages larger than this are streamed (converted chunk by chunk instead of
+# all at once); smaller pages are fetched in a single buffered round trip.
+_STREAM_CHUNK_SIZE = 100
+
 
 # ------------------------------------------------------------------------------
 # GET /listings
 # List all listings with pagination.
+#
+# Two paging modes, both ordered by id:
+# - page/per_page: classic OFFSET paging for jumping to a page number.
+# - after_id/per_page: keyset paging. Pass the previous response's next_cursor
+#   to get the following rows via the primary-key index, so deep pages cost
+#   the same as the first instead of scanning every skipped row. page is
+#   ignored in this mode, and the response's page and total are null:
+#   counting the table would scan every row on every page.
+#
+# Why response_model=None:
+# The page is already validated into PaginatedListingRead here, so the handler
+# serializes it straight to JSON bytes in pydantic-core and returns them.
+# FastAPI would otherwise re-validate every item against the response model and
+# walk the result again before encoding. responses= still documents the
+# schema in Swagger.
 # ------------------------------------------------------------------------------
-@router.get("", response_model=PaginatedListingRead, status_code=status.HTTP_200_OK)
+@router.get(
+    "",
+    response_model=None,
+    responses={200: {"model": PaginatedListingRead}},
+    status_code=status.HTTP_200_OK,
+)
 def list_listings(
     # Query parameter: which page of results to fetch (defaults to 1)
     page: int = 1,
@@ -50,23 +86,80 @@ def list_listings(
     # Query parameter: how many items per page (defaults to 10)
     per_page: int = 10,
 
+    # Query parameter: keyset cursor — return listings with id greater than this
+    after_id: int | None = None,
+
     # Injected database session for queries
     db: Session = Depends(get_db),
-) -> PaginatedListingRead:
-    # Calculate offset (starting row) based on page number
-    offset = max(page - 1, 0) * per_page
-
-    # Fetch rows from the database using limit and offset for pagination
-    rows: list[Listing] = db.query(Listing).offset(offset).limit(per_page).all()
-
-    # Convert ORM objects into Pydantic ListingRead models for safe responses
-    items: list[ListingRead] = [ListingRead.model_validate(row) for row in rows]
+) -> Response:
+    if after_id is not None:
+        # Keyset mode: seek past the cursor using the primary-key index.
+        # No total is computed, so the query only touches the rows it returns.
+        stmt = (
+            select(*_LISTING_READ_COLUMNS)
+            .where(Listing.id > after_id)
+            .order_by(Listing.id)
+            .limit(per_page)
+        )
+    else:
+        # Calculate offset (starting row) based on page number
+        offset = max(page - 1, 0) * per_page
+
+        # Fetch the page of rows together with the total row count in one round
+        # trip. COUNT(*) OVER () is evaluated before OFFSET/LIMIT, so every row
+        # carries the full table count alongside its listing columns.
+        stmt = (
+            select(*_LISTING_READ_COLUMNS, func.count().over().label("total"))
+            .order_by(Listing.id)
+            .offset(offset)
+            .limit(per_page)
+        )
 
-    # Count total number of listings for pagination metadata
-    total: int = db.query(Listing).count()
+    # Large pages: yield_per streams rows from a server-side cursor in
+    # fixed-size batches, so only one batch of rows is held in memory at a time.
+    # Small pages (the common case) skip that: a server-side cursor costs extra
+    # round trips (DECLARE, FETCH, CLOSE) for rows that fit in one batch anyway.
+    if per_page > _STREAM_CHUNK_SIZE:
+        chunks = db.execute(
+            stmt.execution_options(yield_per=_STREAM_CHUNK_SIZE)
+        ).partitions()
+    else:
+        chunks = [db.execute(stmt).all()]
+
+    # Convert each batch of rows into Pydantic ListingRead models
+    # (the extra "total" column in OFFSET mode is ignored by the adapter)
+    items: list[ListingRead] = []
+    total: int | None = None
+    for chunk in chunks:
+        if not chunk:
+            break
+        if total is None and after_id is None:
+            total = chunk[0].total
+        items.extend(
+            _LISTING_LIST_ADAPTER.validate_python(chunk, from_attributes=True)
+        )
 
-    # Return PaginatedListingRead object with items, total count, and pagination info
-    return PaginatedListingRead(items=items, total=total, page=page, per_page=per_page)
+    # Count total number of listings for pagination metadata.
+    # Only an empty OFFSET page (e.g., past the last page) needs a separate
+    # COUNT query; keyset pages report no total.
+    if total is None and after_id is None:
+        total = db.query(Listing).count()
+
+    # Build PaginatedListingRead with items, total count, and pagination info
+    # next_cursor is the last id on this page; pass it back as after_id.
+    # page and total are only provided in OFFSET mode; keyset responses send null.
+    listing_page = PaginatedListingRead(
+        items=items,
+        total=total,
+        page=page if after_id is None else None,
+        per_page=per_page,
+        next_cursor=items[-1].id if items else None,
+    )
+
+    # Serialize once, directly to JSON bytes (no intermediate dicts).
+    return Response(
+        content=listing_page.model_dump_json(), media_type="application/json"
+    )
 
 
 # ------------------------------------------------------------------------------
@@ -81,8 +174,8 @@ def get_listing(
     # Injected database session
     db: Session = Depends(get_db),
 ) -> ListingRead:
-    # Query the database for a listing with this ID
-    listing = db.query(Listing).filter(Listing.id == listing_id).first()
+    # Look up the listing by primary key (checks the identity map before querying)
+    listing = db.get(Listing, listing_id)
 
     # If no record is found, return a 404 error
     if not listing:
@@ -107,22 +200,18 @@ def create_listing(
     # Injected database session
     db: Session = Depends(get_db),
 ) -> ListingRead:
-    # Create a new Listing ORM object from validated input data
-    listing = Listing(**payload.model_dump())
-
-    # Set created_at and updated_at timestamps (UTC-safe)
-    listing.created_at = datetime.now(timezone.utc)
-    listing.updated_at = datetime.now(timezone.utc)
-
-    # Add to session and commit changes to persist to the database
-    db.add(listing)
+    # Insert the validated input data and get the stored row back in the same
+    # round trip via RETURNING, including database-generated values (id,
+    # created_at/updated_at, which Postgres fills via now()).
+    stmt = insert(Listing).values(**payload.model_dump()).returning(Listing)
+    listing = db.scalars(stmt).one()
+
+    # Build the response before commit, which would expire the loaded attributes
+    created = ListingRead.model_validate(listing)
     db.commit()
 
-    # Refresh object so it has database-generated values (e.g., id)
-    db.refresh(listing)
-
     # Return the new record as a Pydantic ListingRead model
-    return ListingRead.model_validate(listing)
+    return created
 
 
 # ------------------------------------------------------------------------------
@@ -140,30 +229,31 @@ def update_listing(
     # Injected database session
     db: Session = Depends(get_db),
 ) -> ListingRead:
-    # Query the database for the listing with this ID
-    listing = db.query(Listing).filter(Listing.id == listing_id).first()
-
-    # If no record is found, return a 404 error
-    if not listing:
+    # Apply only the fields provided in the request body
+    # exclude_unset=True prevents overwriting fields not sent by the client.
+    # updated_at is set to now() by the database as part of the UPDATE, and
+    # RETURNING hands back the updated row without a separate SELECT.
+    stmt = (
+        update(Listing)
+        .where(Listing.id == listing_id)
+        .values(**payload.model_dump(exclude_unset=True))
+        .returning(Listing)
+    )
+    listing = db.scalars(stmt).one_or_none()
+
+    # If no row was updated, the listing does not exist: return a 404 error
+    if listing is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Listing not found",
         )
 
-    # Loop through only the fields provided in the request body
-    # exclude_unset=True prevents overwriting fields not sent by the client
-    for key, value in payload.model_dump(exclude_unset=True).items():
-        setattr(listing, key, value)
-
-    # Update the updated_at timestamp
-    listing.updated_at = datetime.now(timezone.utc)
-
-    # Commit changes and refresh object so it has the latest state
+    # Build the response before commit, which would expire the loaded attributes
+    updated = ListingRead.model_validate(listing)
     db.commit()
-    db.refresh(listing)
 
     # Return the updated record as a Pydantic ListingRead model
-    return ListingRead.model_validate(listing)
+    return updated
 
 
 # ------------------------------------------------------------------------------
@@ -179,7 +269,7 @@ def delete_listing(
     db: Session = Depends(get_db),
 ) -> Response:
     # Query the database for the listing with this ID
-    listing = db.query(Listing).filter(Listing.id == listing_id).first()
+    listing = db.get(Listing, listing_id)
 
     # If no record is found, return a 404 error
     if not listing:
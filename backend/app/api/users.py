@@ -20,6 +20,11 @@ File location:
     backend/app/api/users.py
 """
 
+# --- Standard library imports ---
+# asyncio.to_thread runs blocking work (DB calls, password hashing) off the
+# event loop inside async endpoints.
+import asyncio
+
 # --- FastAPI imports ---
 # APIRouter is used to organize endpoints into logical modules.
 # Depends allows injecting dependencies (like the DB session) into endpoints.
@@ -29,20 +34,34 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 # --- SQLAlchemy imports ---
 # Session represents the database connection context for each request.
-from sqlalchemy.orm import Session
+# undefer() loads the deferred User.role with the user; set_committed_value()
+# fills it in for a new user without marking the object dirty.
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.orm.attributes import set_committed_value
+
+# select() builds narrow column queries; update() with RETURNING writes a row
+# and reads it back in one round trip. literal() feeds the new user's id into
+# an INSERT ... SELECT.
+from sqlalchemy import literal, select, update
+
+# Postgres INSERT supports ON CONFLICT for atomic duplicate-email detection.
+from sqlalchemy.dialects.postgresql import insert
+
+# TypeAdapter validates a whole list of rows in one pydantic-core call.
+from pydantic import TypeAdapter
 
 # --- Local project imports ---
 # Pydantic schemas define input/output validation and shape.
 from app.schemas.user import UserCreate, UserRead, UserUpdate
 
-# Database model for direct ORM interaction
-from app.db.models import User
+# Database models for direct ORM interaction (roles are linked via user_roles)
+from app.db.models import DEFAULT_ROLE, Role, User, user_roles
 
 # Database dependency that provides a session and ensures it's closed.
 from app.db.session import get_db
 
 # Password hashing helper to securely store user passwords.
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 
 # Role-based access control dependency (admin-only routes)
 from app.dependencies.auth_dependencies import require_admin
@@ -54,6 +73,13 @@ router = APIRouter(
     tags=["Users"],  # Label shown in Swagger UI
 )
 
+# Built once at import: validates a list of user rows into UserRead models.
+_USER_LIST_ADAPTER = TypeAdapter(list[UserRead])
+
+# Only the columns UserRead exposes. Notably this leaves out hashed_password,
+# so list queries don't pull a password hash per row off the wire.
+_USER_READ_COLUMNS = tuple(getattr(User, name) for name in UserRead.model_fields)
+
 
 # ------------------------------------------------------------------------------
 # GET /users
@@ -70,12 +96,11 @@ router = APIRouter(
 
 @router.get("/", response_model=list[UserRead], status_code=status.HTTP_200_OK)
 def get_all_users(db: Session = Depends(get_db)):
-    # Query all users from the database.
-    # SQLAlchemy ORM returns a list of User model instances.
-    users = db.query(User).all()
-    # Return the list. FastAPI automatically serializes ORM objects into
-    # the defined Pydantic schema (UserRead) using its `from_attributes` config.
-    return users
+    # Query all users from the database, selecting only the UserRead columns.
+    # The result is plain rows rather than hydrated User instances.
+    rows = db.execute(select(*_USER_READ_COLUMNS)).all()
+    # Convert the rows into the defined Pydantic schema (UserRead) in one pass.
+    return _USER_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
 
 # ------------------------------------------------------------------------------
@@ -92,10 +117,11 @@ def get_all_users(db: Session = Depends(get_db)):
 # No authentication or role enforcement yet — these will be added later
 # once JWT integration is in place.
 # ------------------------------------------------------------------------------
-@router.get("{user_id}", response_model=UserRead, status_code=status.HTTP_200_OK)
+@router.get("/{user_id}", response_model=UserRead, status_code=status.HTTP_200_OK)
 def get_user_by_id(user_id: int, db: Session = Depends(get_db)):
-    # Query the database for a user matching the provided ID.
-    user = db.query(User).filter(User.id == user_id).first()
+    # Query the database for a user matching the provided ID, loading the
+    # derived role in the same SELECT.
+    user = db.get(User, user_id, options=[undefer(User.role)])
 
     # If the user does not exist, raise a standardized 404 HTTP exception.
     if not user:
@@ -120,51 +146,82 @@ def get_user_by_id(user_id: int, db: Session = Depends(get_db)):
 # Notes:
 # - No authentication yet (open for testing).
 # - Passwords are never stored in plaintext.
-# - Email uniqueness is enforced both in the route and by DB constraints.
+# - Email uniqueness is enforced by the DB's unique index (INSERT ... ON CONFLICT).
+# - Async so the slow password hash runs on a worker thread instead of
+#   holding up the event loop.
 # ------------------------------------------------------------------------------
 
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-def create_user(payload: UserCreate, db: Session = Depends(get_db)):
-    # Normalize the email to lowercase for consistency and uniqueness enforcement.
-    normalized_email = payload.email.lower()
-
-    # Check if a user with the same Email already registered.
-    existing_user = (
-        db.query(User).filter(User.email == normalized_email.strip()).first()
-    )
-    if existing_user:
-        # Raise a standardized HTTP 409 Conflict if email is already taken.
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already registered",
-        )
-
+async def create_user(payload: UserCreate, db: Session = Depends(get_db)):
     # Securely hash the provided plaintext password before storing it.
-    hashed_password = get_password_hash(payload.password)
+    hashed_password = await get_password_hash_async(payload.password)
 
-    # Create a new User ORM object from the validated payload.
-    # Pydantic's model_dump() turns the object into a plain dict.
+    # Insert the new user from the validated payload.
     # We explicitly assign the hashed password to avoid including plaintext.
-    new_user = User(
-        email=normalized_email,
-        full_name=payload.full_name,
-        hashed_password=hashed_password,
-        is_active=payload.is_active,
-        role=payload.role or "staff",  # Include role from payload (default to "staff" if not provided)
+    # ON CONFLICT DO NOTHING makes the unique email indexes do the duplicate
+    # check atomically: a taken email inserts nothing and RETURNING is empty.
+    # Otherwise RETURNING hands back the stored row (with DB-generated values
+    # like the auto-incremented ID) in the same round trip, so no refresh is
+    # needed.
+    stmt = (
+        insert(User)
+        .values(
+            email=payload.email,  # already trimmed and lowercased by UserCreate
+            full_name=payload.full_name,
+            hashed_password=hashed_password,
+            is_active=payload.is_active,
+        )
+        .on_conflict_do_nothing()
+        # User.role is deliberately not returned: inside INSERT ... RETURNING
+        # its subquery can't correlate to the new row (see User.role).
+        .returning(User)
     )
 
-    # Add the new user to the session and commit to persist it.
-    db.add(new_user)
-    db.commit()
-
-    # Refresh the instance so it reflects any DB-generated values
-    # (like auto-incremented ID or timestamps).
-    db.refresh(new_user)
+    # Build the response before commit, which would expire the loaded attributes.
+    def _save() -> UserRead:
+        new_user = db.scalars(stmt).one_or_none()
+        if new_user is None:
+            # Raise a standardized HTTP 409 Conflict if email is already taken.
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Email already registered",
+            )
+
+        # Assign the requested role by name from the roles catalog.
+        # INSERT ... SELECT looks the role up and links it in one statement;
+        # an unknown name links nothing and is rejected rather than silently
+        # leaving the user with the default role (the insert is rolled back).
+        role_linked = False
+        if payload.role:
+            linked = db.execute(
+                insert(user_roles).from_select(
+                    ["user_id", "role_id"],
+                    select(literal(new_user.id), Role.id).where(
+                        Role.name == payload.role
+                    ),
+                )
+            )
+            if not linked.rowcount:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown role: {payload.role}",
+                )
+            role_linked = True
+
+        # The derived role is only re-read when a link was actually made;
+        # a user with no roles has the default role.
+        if role_linked:
+            db.refresh(new_user, ["role"])
+        else:
+            set_committed_value(new_user, "role", DEFAULT_ROLE)
+
+        created = UserRead.model_validate(new_user)
+        db.commit()
+        return created
 
     # Return the new user as a Pydantic model.
-    # FastAPI automatically converts the ORM object into the response model.
-    return new_user
+    return await asyncio.to_thread(_save)
 
 
 
@@ -204,33 +261,40 @@ def create_user(payload: UserCreate, db: Session = Depends(get_db)):
 )
 def update_user(user_id: int, payload: UserUpdate, db: Session = Depends(get_db)):
 
-    # Query the database for the user by ID.
-    user = db.query(User).filter(User.id == user_id).first()
-
-    # If no user is found, raise a standardized 404 Not Found error.
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"User with ID {user_id} not found",
-        )
-
     # Update only allowed fields.
     # Email is intentionally locked to prevent accidental reassignment.
-    user.full_name = payload.full_name
+    changes: dict = {"full_name": payload.full_name}
 
     # Only update is_active if the payload explicitly provides a value.
-    # This avoids assigning None to the SQLAlchemy instrumented attribute.
+    # This avoids writing None into the non-nullable column.
     if payload.is_active is not None:
-        user.is_active = payload.is_active
+        changes["is_active"] = payload.is_active
+
+    # RETURNING gives back the UserRead columns of the updated row (including
+    # the derived role, which correlates to the row in an UPDATE), so no
+    # refresh SELECT is needed.
+    stmt = (
+        update(User)
+        .where(User.id == user_id)
+        .values(**changes)
+        .returning(*_USER_READ_COLUMNS)
+    )
+    user = db.execute(stmt).one_or_none()
 
-    # Commit changes to the database so they persist.
-    db.commit()
+    # If no row was updated, raise a standardized 404 Not Found error.
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with ID {user_id} not found",
+        )
 
-    # Refresh ensures we return the most up-to-date version of the record.
-    db.refresh(user)
+    # Build the response from the returned row, then commit the changes so
+    # they persist.
+    updated = UserRead.model_validate(user)
+    db.commit()
 
     # Return the updated user record.
-    return user
+    return updated
 
 
 
@@ -250,7 +314,7 @@ def update_user(user_id: int, payload: UserUpdate, db: Session = Depends(get_db)
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user(user_id: int, db: Session = Depends(get_db)):
     # Look up the user by ID.
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
 
     # If the user doesn't exist, raise a 404 error.
     if not user:
@@ -8,7 +8,7 @@ hardcoding values in the codebase.
 
 from pathlib import Path
 from typing import ClassVar, Optional
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -53,20 +53,40 @@ class Settings(BaseSettings):
     JWT_ISSUER: str = Field(..., description="Token issuer identifier")
     JWT_AUDIENCE: str = Field(..., description="Token audience identifier") 
 
+    # Connection pool / engine tuning (see app/db/session.py)
+    DB_POOL_SIZE: int = Field(10, description="Connections kept open in the pool")
+    DB_MAX_OVERFLOW: int = Field(20, description="Extra connections allowed during bursts")
+    DB_POOL_TIMEOUT: int = Field(30, description="Seconds to wait for a free connection")
+    DB_POOL_RECYCLE: int = Field(1800, description="Replace connections older than this (seconds)")
+    DB_ECHO: bool = Field(False, description="Log every SQL statement (debugging only)")
+    AUTO_CREATE_TABLES: bool = Field(
+        False, description="Run create_all at startup (local dev; use Alembic elsewhere)"
+    )
+
+    # Password hashing cost (argon2id). Defaults follow the OWASP minimum;
+    # raise them on hardware that can afford a slower login.
+    PASSWORD_HASH_TIME_COST: int = Field(2, description="argon2id iterations")
+    PASSWORD_HASH_MEMORY_COST: int = Field(19456, description="argon2id memory in KiB")
+    PASSWORD_HASH_PARALLELISM: int = Field(1, description="argon2id lanes")
+
 
 
     # Application environment (safe default for non-critical behavior)
     ENV: str = Field("dev", description="Runtime environment")
 
     # Pydantic Settings configuration
+    # frozen: settings are read-only after the single construction in
+    # get_settings(), so nothing can mutate (and re-validate) them at runtime.
     model_config = SettingsConfigDict(
         env_file=env_path,
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # Helper that returns a usable SQLAlchemy URL
-    @property
+    # (built once per Settings instance; get_settings() returns a single one)
+    @cached_property
     def effective_database_url(self) -> str:
         if self.DATABASE_URL:
             return self.DATABASE_URL
@@ -76,8 +96,10 @@ class Settings(BaseSettings):
         )
 
 
+# Cached: the environment is read once per process. Hot paths that need
+# individual values (JWT signing/verification, engine creation) build their
+# own cached views from this single instance.
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     # Pydantic loads from env; static analyzers can't infer this constructor pattern.
     return Settings()  # type: ignore[call-arg]
-settings = get_settings()
\ No newline at end of file
@@ -7,65 +7,137 @@ This module provides secure password hashing and JWT creation functions
 for user authentication.
 
 Part 1: Password Hashing
-- get_password_hash(password): returns a secure bcrypt hash suitable for storage
+- get_password_hash(password): returns a secure argon2id hash suitable for storage
 - verify_password(plain_password, hashed_password): verifies a user login attempt
+- get_password_hash_async / verify_password_async: the same, run on a worker
+  thread for use inside async routes
 
 Part 2: JWT Creation
 - create_access_token(subject): generates a signed JSON Web Token for
   authenticated users.
 
 Why these tools:
-- Passlib (for password hashing) provides strong, upgradable security.
+- argon2-cffi (for password hashing) provides argon2id, the current
+  recommended password hash; bcrypt is kept only to verify older hashes.
 - JWT (JSON Web Tokens) provides stateless authentication between backend and frontend.
+  PyJWT signs HS256 tokens through the standard library's C-backed hmac.
 """
 
 # =========================================================
 # Imports
 # =========================================================
-# Password hashing library
-from passlib.context import CryptContext
+# Password hashing libraries
+import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# Runs the slow hash work off the event loop for async callers
+import asyncio
+
+# Short cache keys for verified tokens
+import hashlib
 
 # JWT handling and time utilities
-from datetime import datetime, timedelta, timezone
-from jose import jwt
+import threading
+import time
+from functools import lru_cache, partial
+from typing import NamedTuple
+
+import jwt
+import orjson
+from cachetools import TTLCache
+from jwt import api_jws
 
 # Application settings (loads secret key, algorithm, issuer, etc.)
 from app.core.config import get_settings
 
 # Exceptions for invalid or expired JWTs
-from jose.exceptions import JWTError, ExpiredSignatureError
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
 
 # =========================================================
 # Password Hashing Utilities
 # =========================================================
-# A single, app-wide password hashing context.
-# Using bcrypt for broad compatibility and security.
-# "deprecated"='auto' future-proofs the setup by allowing Passlib
-# to flag older hashes for rehashing if the algorithm is ever updated.
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# A single, app-wide argon2id hasher, built on first use so importing this
+# module doesn't load settings.
+# The cost comes from settings; the defaults follow the OWASP minimum for
+# argon2id (19 MiB memory, 2 passes, 1 lane), which keeps a login hash in the
+# tens of milliseconds while staying memory-hard against GPU cracking.
+@lru_cache(maxsize=1)
+def _password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return PasswordHasher(
+        time_cost=settings.PASSWORD_HASH_TIME_COST,
+        memory_cost=settings.PASSWORD_HASH_MEMORY_COST,
+        parallelism=settings.PASSWORD_HASH_PARALLELISM,
+    )
+
+# Prefix shared by bcrypt hashes created before the switch to argon2id.
+_BCRYPT_PREFIX = "$2"
 
 
 def get_password_hash(password: str) -> str:
     """
-    Hash a plaintext password using the configured CryptContext.
+    Hash a plaintext password with argon2id.
 
     Returns:
-        str: A salted, versioned hash string (e.g., starting with $2b$ for bcrypt)
+        str: A salted, versioned hash string (starting with $argon2id$)
              that is safe to store in the database.
     """
-    return _pwd_context.hash(password)
+    return _password_hasher().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a user-supplied password against the stored hash.
 
+    Accounts created before the move to argon2id still carry bcrypt hashes,
+    so those are checked with bcrypt instead.
+
     Returns:
         bool: True if the password is correct, otherwise False.
     """
+    if hashed_password.startswith(_BCRYPT_PREFIX):
+        # bcrypt only reads the first 72 bytes; Passlib truncated the same way.
+        return bcrypt.checkpw(plain_password.encode()[:72], hashed_password.encode())
+
+    try:
+        return _password_hasher().verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced after a successful login.
+
+    True for legacy bcrypt hashes and for argon2 hashes made with cost
+    settings other than the current ones.
+
+    Returns:
+        bool: True if the password should be hashed again with get_password_hash.
+    """
+    if hashed_password.startswith(_BCRYPT_PREFIX):
+        return True
+
+    try:
+        return _password_hasher().check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return False
 
-    return _pwd_context.verify(plain_password, hashed_password)
+
+# Async wrappers for routes running on the event loop.
+# Hashing is deliberately slow CPU work; calling it directly from an async
+# endpoint would stall every other request until the hash finishes. argon2
+# and bcrypt release the GIL while hashing, so worker threads run in parallel.
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on a worker thread (see get_password_hash)."""
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on a worker thread (see verify_password)."""
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
 
 
 # =========================================================
@@ -80,8 +152,32 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 # - iss / aud: issuer and audience identifiers for validation
 # =========================================================
 
-# Load settings so the app can read SECRET_KEY, algorithm, issuer, audience, and expiry time.
-settings = get_settings()
+# JWT parameters are read from settings once, on the first token issued or
+# verified, instead of on every call. The iss/aud claims never change, so they
+# live in a base dict that each payload is built from. iat/exp are written as
+# integer Unix timestamps, so the encoder has no datetime values to convert.
+class _JWTConfig(NamedTuple):
+    secret: bytes
+    algorithm: str
+    issuer: str
+    audience: str
+    ttl_seconds: int
+    base_claims: dict
+
+
+@lru_cache(maxsize=1)
+def _jwt_config() -> _JWTConfig:
+    settings = get_settings()
+    return _JWTConfig(
+        # Encoded once: PyJWT's HMAC key preparation would otherwise
+        # str.encode() the secret on every sign and verify.
+        secret=settings.SECRET_KEY.encode(),
+        algorithm=settings.JWT_ALGORITHM,
+        issuer=settings.JWT_ISSUER,
+        audience=settings.JWT_AUDIENCE,
+        ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        base_claims={"iss": settings.JWT_ISSUER, "aud": settings.JWT_AUDIENCE},
+    )
 
 
 def create_access_token(subject: str, role: str, expires_delta: int | None = None) -> str:
@@ -96,21 +192,24 @@ def create_access_token(subject: str, role: str, expires_delta: int | None = Non
     Returns:
         str: Encoded JWT token string
     """
-    issued_at = datetime.now(timezone.utc)
-    expires_at = issued_at + timedelta(
-        minutes=expires_delta or settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
+    config = _jwt_config()
+    issued_at = int(time.time())
+    lifetime = expires_delta * 60 if expires_delta else config.ttl_seconds
 
     payload = {
+        **config.base_claims,
         "sub": subject,
         "role": role,  # Added role claim for role-based access
         "iat": issued_at,
-        "exp": expires_at,
-        "iss": settings.JWT_ISSUER,
-        "aud": settings.JWT_AUDIENCE,
+        "exp": issued_at + lifetime,
     }
 
-    token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    # The claims are plain str/int values, so orjson serializes them and PyJWS
+    # only signs the bytes. jwt.encode would copy the dict, scan it for
+    # datetimes and run it through the stdlib json encoder first.
+    token = api_jws.encode(
+        orjson.dumps(payload), config.secret, algorithm=config.algorithm
+    )
     return token
 
 
@@ -126,10 +225,40 @@ def create_access_token(subject: str, role: str, expires_delta: int | None = Non
 # =========================================================
 
 
+# jwt.decode with the key, algorithm list, audience and issuer bound once,
+# so verifying a token doesn't rebuild those arguments on every request.
+@lru_cache(maxsize=1)
+def _jwt_decoder() -> partial:
+    config = _jwt_config()
+    return partial(
+        jwt.decode,
+        key=config.secret,
+        algorithms=[config.algorithm],
+        audience=config.audience,
+        issuer=config.issuer,
+    )
+
+
+# Short-lived cache of verified token claims, keyed by a 16-byte BLAKE2b
+# digest of the token rather than the token itself, so entries don't pin
+# several-hundred-byte token strings and each probe hashes a short key.
+# Clients send the same bearer token on every request, so for up to 30
+# seconds a repeat token is served from here without the signature check.
+# TTLCache is not thread-safe and sync dependencies run in a threadpool,
+# so access goes through a lock.
+_verified_tokens: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_verified_tokens_lock = threading.Lock()
+
+
 def verify_access_token(token: str) -> dict:
     """
     Decode and validate a JWT received from a client request.
 
+    Recently verified tokens are answered from a short-lived cache. Cached
+    claims are only trusted while their 'exp' is still in the future;
+    otherwise the token is verified again so expiry errors surface as usual.
+    Failed verifications are never cached.
+
     Args:
         token (str): The JWT string to verify.
 
@@ -138,24 +267,30 @@ def verify_access_token(token: str) -> dict:
 
     Raises:
         ExpiredSignatureError: If the token has expired.
-        JWTError: If the token is invalid or cannot be decoded.
+        InvalidTokenError: If the token is invalid or cannot be decoded.
     """
 
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _verified_tokens_lock:
+        cached_payload = _verified_tokens.get(cache_key)
+
+    if cached_payload is not None and cached_payload.get("exp", 0) > time.time():
+        return cached_payload
+
     # Attempt to decode and validate the token
     try:
-        decoded_payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
-            audience=settings.JWT_AUDIENCE,
-            issuer=settings.JWT_ISSUER,
-        )
-        return decoded_payload
+        decoded_payload = _jwt_decoder()(token)
 
     # Handle expired tokens separately for clarity
     except ExpiredSignatureError:
         raise ExpiredSignatureError("Token has expired")
 
     # Handle all other JWT-related errors
-    except JWTError:
-        raise JWTError("Token is invalid or corrupted")
+    except InvalidTokenError:
+        raise InvalidTokenError("Token is invalid or corrupted")
+
+    with _verified_tokens_lock:
+        _verified_tokens[cache_key] = decoded_payload
+
+    return decoded_payload
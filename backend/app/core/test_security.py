@@ -1,17 +1,55 @@
 # backend/app/core/test_security.py
 
 """
-Unit tests for JWT token creation and verification.
+Unit tests for password hashing and JWT token creation and verification.
 
 These tests confirm that:
+- get_password_hash() produces argon2id hashes that verify_password() accepts
+- verify_password() still accepts legacy bcrypt hashes
+- password_needs_rehash() flags legacy bcrypt hashes for upgrade
 - create_access_token() produces a valid JWT string
-- verify_access_token() decodes it correctly
+- verify_access_token() decodes it correctly and reuses recently verified claims
 - Invalid or expired tokens raise the expected errors
 """
 
+import bcrypt
 import pytest
-from jose import JWTError
-from app.core.security import create_access_token, verify_access_token
+from jwt.exceptions import InvalidTokenError
+from app.core.security import (
+    create_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_access_token,
+    verify_password,
+)
+
+
+def test_password_hash_roundtrip():
+    """
+    Verify that a freshly hashed password verifies and a wrong one does not.
+    """
+    hashed = get_password_hash("s3cret")
+    assert hashed.startswith("$argon2id$")
+    assert verify_password("s3cret", hashed)
+    assert not verify_password("wrong", hashed)
+
+
+def test_verify_legacy_bcrypt_hash():
+    """
+    Verify that bcrypt hashes stored before the argon2id switch still work.
+    """
+    legacy = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode()
+    assert verify_password("s3cret", legacy)
+    assert not verify_password("wrong", legacy)
+
+
+def test_password_needs_rehash():
+    """
+    Verify that only legacy bcrypt hashes are flagged for re-hashing.
+    """
+    legacy = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode()
+    assert password_needs_rehash(legacy)
+    assert not password_needs_rehash(get_password_hash("s3cret"))
 
 
 def test_create_and_verify_token():
@@ -25,23 +63,32 @@ def test_create_and_verify_token():
     assert decoded["role"] == "admin"
 
 
+def test_verify_access_token_reuses_cached_claims():
+    """
+    Verify that a repeat token is answered from the cache of verified claims.
+    """
+    token = create_access_token("cached_user", role="staff")
+    first = verify_access_token(token)
+    assert verify_access_token(token) is first
+
+
 def test_invalid_token():
     """
-    Verify that an invalid token raises a JWTError.
+    Verify that an invalid token raises an InvalidTokenError.
     """
-    with pytest.raises(JWTError):
+    with pytest.raises(InvalidTokenError):
         verify_access_token("this.is.not.a.valid.token")
 
 
 def test_expired_token():
     """
-    Verify that an expired token raises a JWTError.
+    Verify that an expired token raises an InvalidTokenError.
     """
     subject = "expired_user"
 
     # Create a token that expired one minute ago
     token = create_access_token(subject, expires_delta=-1, role="admin")
 
-    with pytest.raises(JWTError):
+    with pytest.raises(InvalidTokenError):
         verify_access_token(token)
 
@@ -0,0 +1,27 @@
+# backend/app/core/test_user_schema.py
+
+"""
+Unit tests for email normalization in the user schemas.
+
+These tests confirm that:
+- UserCreate stores emails trimmed and lowercased
+- normalize_email() (used by login) produces the same form UserCreate stores
+"""
+
+from app.schemas.user import UserCreate, normalize_email
+
+
+def test_user_create_normalizes_email():
+    """
+    Verify that surrounding whitespace and letter case are removed on input.
+    """
+    user = UserCreate(email="  Ann.Smith@Example.COM ", password="s3cret")
+    assert user.email == "ann.smith@example.com"
+
+
+def test_login_normalization_matches_user_create():
+    """
+    Verify that a login email matches the stored form in any letter case.
+    """
+    stored = UserCreate(email="Ann@Example.com", password="s3cret").email
+    assert normalize_email(" ANN@example.COM") == stored
@@ -13,15 +13,17 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
-    Numeric,
+    Float,
     DateTime,
     Boolean,
     ForeignKey,
     Table,
+    Index,
 )
 
+from sqlalchemy import select
 from sqlalchemy.sql import func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 from datetime import datetime
 
 # Base is the SQLAlchemy declarative base defined in your session setup
@@ -29,6 +31,13 @@ from datetime import datetime
 from app.db.base import Base
 
 
+# Timestamps are stored as naive UTC (TIMESTAMP WITHOUT TIME ZONE), so rows
+# load as plain datetimes with no tzinfo to attach. This is the database-side
+# "now" in UTC for their defaults and on-update values.
+def utc_now():
+    return func.timezone("utc", func.now())
+
+
 class Listing(Base):
     """
     Real estate listing record.
@@ -36,6 +45,13 @@ class Listing(Base):
 
     __tablename__ = "listings"
 
+    # B-tree indexes for the usual search filters: location first (equality),
+    # then price as a range; and room counts for "N+ beds / baths" filters.
+    __table_args__ = (
+        Index("ix_listings_city_state_price", "city", "state", "price"),
+        Index("ix_listings_bedrooms_bathrooms", "bedrooms", "bathrooms"),
+    )
+
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
@@ -67,8 +83,10 @@ class Listing(Base):
     # Number of bedrooms
     bedrooms: Mapped[int] = mapped_column(Integer, nullable=False)
 
-    # Number of bathrooms, stored with one decimal place (e.g., 1.5, 2.0)
-    bathrooms: Mapped[float] = mapped_column(Numeric(3, 1), nullable=False)
+    # Number of bathrooms in half increments (e.g., 1.5, 2.0)
+    # Stored as a float rather than NUMERIC: halves are exact in binary, and
+    # the driver returns floats directly instead of building a Decimal per row.
+    bathrooms: Mapped[float] = mapped_column(Float, nullable=False)
 
     # Public URL to the cover image
     cover_image: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -76,16 +94,16 @@ class Listing(Base):
     # Audit fields
     # Timestamp set when record is created
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
+        DateTime(timezone=False),
+        server_default=utc_now(),
         nullable=True,
     )
 
     # Timestamp updated automatically when record is modified
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        DateTime(timezone=False),
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=True,
     )
 
@@ -129,8 +147,8 @@ class Role(Base):
 
     # Timestamp set when record is created
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
+        DateTime(timezone=False),
+        server_default=utc_now(),
         nullable=False,
     )
     # Users assigned to this role
@@ -141,6 +159,13 @@ class Role(Base):
     )
 
 
+# Effective role of a user with no roles assigned (see User.role)
+DEFAULT_ROLE = "staff"
+
+# Roles every database starts with (seeded by migrations and AUTO_CREATE_TABLES)
+BUILTIN_ROLES = ("admin", DEFAULT_ROLE)
+
+
 class User(Base):
     """
     Database model for application users.
@@ -154,9 +179,6 @@ class User(Base):
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
-    # User role for access control ("admin", "user", etc.)
-    role = Column(String, nullable=False, default="staff")
-    
     # Email address (must be unique)
     email: Mapped[str] = mapped_column(
         String(320), unique=True, nullable=False, index=True
@@ -173,9 +195,9 @@ class User(Base):
 
     # Timestamp set when record is created
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        DateTime(timezone=False),
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=True,
     )
 
@@ -185,3 +207,28 @@ class User(Base):
         secondary="user_roles",
         back_populates="users",
     )
+
+    # Effective role for access control ("admin", "staff", etc.), derived from
+    # the roles above: admin if assigned, else the first assigned role, else
+    # DEFAULT_ROLE. A correlated subquery rather than a stored column, so it
+    # can't drift from user_roles. Deferred, so plain User SELECTs don't carry
+    # the subquery: queries that need it add options(undefer(User.role)) to
+    # load it in the same SELECT as the user.
+    # Not usable in INSERT ... RETURNING: there the subquery can't correlate
+    # to the new row and would read every user's roles instead.
+    role: Mapped[str] = column_property(
+        func.coalesce(
+            select(Role.name)
+            .join(user_roles, user_roles.c.role_id == Role.id)
+            .where(user_roles.c.user_id == id)
+            .order_by((Role.name == "admin").desc(), Role.id)
+            .limit(1)
+            .scalar_subquery(),
+            DEFAULT_ROLE,
+        ),
+        deferred=True,
+    )
+
+
+# Case-insensitive uniqueness for user emails; also serves LOWER(email) lookups
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
@@ -6,7 +6,10 @@ configuration loaded from backend/app/core/config.py. It respects the
 DATABASE_URL from the .env file, or falls back to individual Postgres parts.
 """
 
+import logging
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
@@ -14,18 +17,28 @@ from app.core.config import get_settings
 # Load settings once (cached by lru_cache in config)
 settings = get_settings()
 
-# --- Debug: verify effective DB URL (mask password) ---
-try:
-    masked_url = settings.effective_database_url.replace(settings.POSTGRES_PASSWORD, "******")
-except Exception:
-    masked_url = "<unavailable>"
-print(f"[config] effective_database_url = {masked_url}")
+logger = logging.getLogger(__name__)
+
+# --- Debug: log the effective DB URL (password hidden) in dev only ---
+if settings.ENV == "dev":
+    logger.debug(
+        "effective_database_url = %s",
+        make_url(settings.effective_database_url).render_as_string(hide_password=True),
+    )
 
 
 # Create the engine using the effective DB URL (honors .env DATABASE_URL)
+# Pool sizing and SQL echo come from settings so each environment can tune
+# them. Echo stays off unless DB_ECHO is set: it formats and logs every
+# statement, which costs more than the query itself on small lookups.
 engine = create_engine(
     settings.effective_database_url,
+    echo=settings.DB_ECHO,
+    pool_size=settings.DB_POOL_SIZE,  # connections kept open in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # extra connections allowed during bursts
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # seconds to wait for a free connection
     pool_pre_ping=True,  # helps recover dropped connections
+    pool_recycle=settings.DB_POOL_RECYCLE,  # replace connections older than this
 )
 
 # Session factory
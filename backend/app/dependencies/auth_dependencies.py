@@ -8,97 +8,107 @@ and identify the current authenticated user. These dependencies can be
 attached to protected routes using FastAPI's Depends() mechanism.
 """
 
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
-from jose.exceptions import JWTError, ExpiredSignatureError
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 
 # Import the token verification function
 from app.core.security import verify_access_token
 
 
 # Define the token scheme expected by the app (Authorization: Bearer <token>)
-from fastapi.security import HTTPBearer
-
-from typing import Any
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 oauth2_scheme = HTTPBearer()
 
+# Response header sent with every 401, built once and shared by all of them.
+# Only the headers are shared: each failure still raises a fresh
+# HTTPException, because re-raising one shared instance keeps extending its
+# traceback and would leak frames across requests.
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+
+
+@dataclass(slots=True, frozen=True)
+class Principal:
+    """
+    The authenticated caller, built once per request from the verified JWT.
 
-def get_current_user(token: Any = Depends(oauth2_scheme)) -> str:
+    Every downstream dependency (role checks, auditing) reads this object
+    instead of looking at the raw token or claims dict again.
     """
-    Verify and decode the JWT from the Authorization header.
+
+    sub: str  # user identity (email)
+    role: str  # "admin", "staff", ...
+    exp: int  # token expiry as a Unix timestamp
+
+
+def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
+) -> Principal:
+    """
+    Verify the JWT from the Authorization header and return the caller.
+
+    This is the only place a token is decoded. require_admin builds on this
+    dependency, and FastAPI resolves a dependency once per request, so a
+    route that uses both still verifies the token once. Repeat tokens are
+    served from verify_access_token's short-lived cache.
 
     Returns:
-        str: The 'sub' claim (subject) from the token, which identifies the user.
+        Principal: The caller's identity ('sub'), role and token expiry.
 
     Raises:
         HTTPException: If the token is missing, expired, or invalid.
     """
 
-    # Attempt to decode the token and extract its payload
-    # NOTE: HTTPBearer returns an object with a .credentials attribute,
-    # while OAuth2PasswordBearer returns a plain string. This supports both.
-    raw_token: str = getattr(token, "credentials", token)
-
     try:
-        payload = verify_access_token(raw_token)
-        user_email = payload.get("sub")
-
-        # Ensure the token has a subject claim
-        if user_email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token missing subject claim",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        # Return the verified user identity (email for now)
-        return user_email
+        payload = verify_access_token(creds.credentials)
 
     # Handle token expiration separately for clarity
     except ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has expired",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+            headers=_BEARER_CHALLENGE,
+        ) from None
 
     # Handle invalid or malformed tokens
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or corrupted token",
-            headers={"WWW-Authenticate": "Bearer"},
+            headers=_BEARER_CHALLENGE,
+        ) from None
+
+    # Ensure the token has a subject claim
+    sub = payload.get("sub")
+    if sub is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token missing subject claim",
+            headers=_BEARER_CHALLENGE,
         )
 
+    return Principal(sub=sub, role=payload.get("role", ""), exp=payload.get("exp", 0))
 
 
-def require_admin(token: Any = Depends(oauth2_scheme)) -> str:
+# use_cache=True is FastAPI's default, spelled out because the single decode
+# per request depends on it: the Principal is cached under get_current_user,
+# so a route that also lists get_current_user gets the same object. Admin
+# routes only need to list require_admin.
+def require_admin(
+    principal: Principal = Depends(get_current_user, use_cache=True),
+) -> str:
     """
     Dependency that restricts access to admin-only routes.
 
-    Verifies the JWT from the Authorization header, checks the 'role' claim,
-    and raises 403 for non-admins. Returns the 'sub' (email) for logging/auditing.
+    Checks the caller's role and raises 403 for non-admins.
+    Returns the 'sub' (email) for logging/auditing.
     """
-    # HTTPBearer provides an object with .credentials; support both object and raw str
-    raw_token: str = getattr(token, "credentials", token)
-
-    # Decode the JWT directly from the header token
-    payload = verify_access_token(raw_token)
-
-    role = payload.get("role")
-    if role != "admin":
+    if principal.role != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
         )
 
-    sub = payload.get("sub")
-    if sub is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token missing subject claim",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    return sub
-
+    return principal.sub
@@ -0,0 +1,93 @@
+# backend/app/dependencies/test_auth_dependencies.py
+
+"""
+Unit tests for the authentication dependencies.
+
+These tests mount require_admin on a tiny FastAPI app and confirm that:
+- An admin token is accepted and the caller's 'sub' is passed through
+- A non-admin token is refused with 403
+- Expired or malformed tokens, and tokens without 'sub', get a 401 with a
+  Bearer challenge instead of a server error
+"""
+
+import time
+
+import jwt
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import get_settings
+from app.core.security import create_access_token
+from app.dependencies.auth_dependencies import require_admin
+
+app = FastAPI()
+
+
+@app.get("/admin-only")
+def admin_only(sub: str = Depends(require_admin)):
+    return {"sub": sub}
+
+
+client = TestClient(app)
+
+
+def _get_with_token(token: str):
+    return client.get("/admin-only", headers={"Authorization": f"Bearer {token}"})
+
+
+def test_admin_token_allowed():
+    """
+    Verify that an admin token reaches the route with its subject.
+    """
+    response = _get_with_token(create_access_token("admin@example.com", role="admin"))
+    assert response.status_code == 200
+    assert response.json() == {"sub": "admin@example.com"}
+
+
+def test_staff_token_forbidden():
+    """
+    Verify that a valid non-admin token is refused with 403.
+    """
+    response = _get_with_token(create_access_token("staff@example.com", role="staff"))
+    assert response.status_code == 403
+
+
+def test_expired_token_unauthorized():
+    """
+    Verify that an expired token gets a 401 with a Bearer challenge.
+    """
+    token = create_access_token("old@example.com", expires_delta=-1, role="admin")
+    response = _get_with_token(token)
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+def test_garbage_token_unauthorized():
+    """
+    Verify that a malformed token gets a 401 with a Bearer challenge.
+    """
+    response = _get_with_token("this.is.not.a.valid.token")
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+def test_token_without_subject_unauthorized():
+    """
+    Verify that a correctly signed token with no 'sub' claim gets a 401.
+    """
+    settings = get_settings()
+    now = int(time.time())
+    token = jwt.encode(
+        {
+            "iss": settings.JWT_ISSUER,
+            "aud": settings.JWT_AUDIENCE,
+            "role": "admin",
+            "iat": now,
+            "exp": now + 60,
+        },
+        settings.SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+    response = _get_with_token(token)
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
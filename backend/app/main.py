@@ -2,14 +2,19 @@
 Main application entrypoint.
 
 - Creates the FastAPI app instance.
-- Ensures database connectivity at startup.
-- Includes API routers (example + listings).
+- In local dev, creates tables at startup when AUTO_CREATE_TABLES is set.
+- Includes API routers (example, listings, auth, users).
 - Provides a simple root endpoint for health checks.
+
+This is the only application module; run it with `uvicorn app.main:app`.
 """
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import text
+
+# Postgres INSERT ... ON CONFLICT, for seeding the built-in roles idempotently
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 # --- Internal imports ---
 # Base class for all SQLAlchemy models (used to create tables)
@@ -18,10 +23,12 @@ from app.db.base import Base
 # Engine + session setup (engine built from .env via config.py)
 from app.db.session import engine
 
-# Importing models ensures they are registered with Base.metadata
-# Even if not directly used here, this is important so migrations / create_all
-# know about your tables.
-from app.db import models  # noqa: F401
+# Settings (AUTO_CREATE_TABLES flag)
+from app.core.config import get_settings
+
+# Importing models ensures they are registered with Base.metadata, so
+# create_all knows about your tables (Role is also used to seed roles).
+from app.db import models
 
 # API routers
 from app.api.example import router as example_router
@@ -31,13 +38,14 @@ from app.api.auth import router as auth_router
 
 from app.api.users import router as users_router
 
-# --- Database setup ---
-# Creates tables in the database on app startup.
-# Note: This is temporary — we'll replace with Alembic migrations.
-Base.metadata.create_all(bind=engine)
+# Configure all mappers (relationships, back-populates) once at import, so the
+# first request doesn't pay for it.
+Base.registry.configure()
 
 # --- FastAPI app instance ---
-app = FastAPI()
+# ORJSONResponse as the default response class: every JSON response is encoded
+# by orjson (C, native datetime support) instead of the stdlib json module.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # --- CORS setup ---
 # Allows the Angular dev server to call the FastAPI backend during local development.
@@ -51,14 +59,27 @@ app.add_middleware(
 
 
 # --- Startup event ---
+# There is no connectivity probe here: workers don't each spend a round trip
+# on boot, and the engine's pool_pre_ping checks every connection as it is
+# handed to a request.
 @app.on_event("startup")
-def _db_connectivity_check() -> None:
+def _create_tables() -> None:
     """
-    On app startup, run a simple SQL query (`SELECT 1`) against Postgres.
-    If this fails, it means the app cannot connect to the database.
+    Create any missing tables, only when AUTO_CREATE_TABLES is enabled.
+
+    This is a local-development convenience. Deployed environments manage the
+    schema with `alembic upgrade head`, so workers don't each run DDL (and a
+    round trip per table) at boot. Like the migrations, it also seeds the
+    built-in roles, so role assignment works on a fresh database.
     """
-    with engine.connect() as conn:
-        conn.execute(text("SELECT 1"))
+    if get_settings().AUTO_CREATE_TABLES:
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(
+                pg_insert(models.Role)
+                .values([{"name": name} for name in models.BUILTIN_ROLES])
+                .on_conflict_do_nothing()
+            )
 
 
 # --- Routers ---
@@ -75,10 +96,16 @@ app.include_router(auth_router)
 app.include_router(users_router)
 
 # --- Root endpoint ---
-@app.get("/")
-def read_root():
+# Load balancers probe this every few seconds, so the body is built once here
+# and sent as-is: no JSON encoding per probe. It is async so a probe doesn't
+# take a threadpool slot, and left out of the OpenAPI schema.
+_HEALTH_BODY = b'{"status":"ok","message":"Real Estate API up"}'
+
+
+@app.get("/", include_in_schema=False)
+async def read_root() -> Response:
     """
     Basic health check endpoint.
     Returns a JSON payload confirming the API is online.
     """
-    return {"status": "ok", "message": "Real Estate API up"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
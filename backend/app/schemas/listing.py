@@ -2,22 +2,30 @@
 # Fields follow our spec: price, address, city, state, description, sqft,
 # bedrooms, bathrooms (half-increments), and a single cover image URL.
 
-# Ensures type annotations are treated as strings until evaluated
-# (helps with forward references and circular imports).
-from __future__ import annotations
-
 # For timestamp fields (created_at, updated_at).
 from datetime import datetime
 
 # Standard typing helpers: Optional for nullable fields, List for collections.
-from typing import Optional, List
+from typing import Annotated, Optional, List
 
 # Pydantic: FastAPI's schema and validation layer.
 # BaseModel: parent class for all schemas
 # Field: attach metadata and validation rules
 # ConfigDict: control schema behavior (e.g., ORM mode)
 # HttpUrl: validates that a string is a proper URL
-from pydantic import BaseModel, Field, ConfigDict
+# PlainSerializer: custom JSON output for a field type
+from pydantic import BaseModel, Field, ConfigDict, PlainSerializer
+
+
+# Timestamps come out of the database as naive UTC datetimes. Mark them as UTC
+# in JSON ("...Z") so clients don't read them as local time.
+def _utc_isoformat(value: datetime) -> str:
+    if value.tzinfo is None:
+        return value.isoformat() + "Z"
+    return value.isoformat()
+
+
+UTCDatetime = Annotated[datetime, PlainSerializer(_utc_isoformat, when_used="json")]
 
 
 # Shared base schema: foundation for create/read/update variants.
@@ -73,17 +81,24 @@ class ListingUpdate(BaseModel):
 # Schema for reading a listing: includes server-managed fields.
 class ListingRead(ListingBase):
     id: int
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    # Rows were checked against ListingBase on the way in, so reads skip the
+    # per-item half-increment (float modulus) check.
+    bathrooms: float = Field(..., description="Number of bathrooms, in half increments")
+    created_at: Optional[UTCDatetime] = None
+    updated_at: Optional[UTCDatetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    # Read-only once built from a row
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Schema for paginated responses: includes listings plus paging metadata.
 class PaginatedListingRead(BaseModel):
     items: List[ListingRead]
-    total: int
-    page: int
+    # page number and total row count in OFFSET mode; None when paging by after_id
+    total: Optional[int] = None
+    page: Optional[int] = None
     per_page: int
+    # id of the last item on this page; send it as after_id for the next page
+    next_cursor: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
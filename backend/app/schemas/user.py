@@ -1,7 +1,13 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, field_validator
 from typing import List, Optional
 
 
+# Canonical stored form of an email: trimmed and lowercased. Used by UserCreate
+# and by login, so stored and looked-up emails always compare equal.
+def normalize_email(value: str) -> str:
+    return value.strip().lower()
+
+
 class UserBase(BaseModel):
     email: EmailStr
     full_name: Optional[str] = None
@@ -44,16 +50,16 @@ class RoleRead(BaseModel):
     # Optional description for clarity in the API
     description: Optional[str] = None
 
-    # orm_mode allows returning SQLAlchemy objects directly
-    class Config:
-        orm_mode = True
+    # from_attributes allows returning SQLAlchemy objects directly
+    model_config = ConfigDict(from_attributes=True)
 
 
 # -----------------------------------------------
 # USER READ SCHEMA
 # -----------------------------------------------
 # Used when returning user data to clients.
-# Adds the user's assigned roles for clarity.
+# Exposes the effective role as a plain name rather than nested RoleRead
+# objects; RoleRead stays for endpoints that need a role's id/description.
 class UserRead(BaseModel):
     # User's unique ID
     id: int
@@ -67,12 +73,11 @@ class UserRead(BaseModel):
     # Whether the account is active
     is_active: bool
 
-    # Match the new users.role column
+    # Effective role derived from the user's assigned roles (see User.role)
     role: str
 
-    # Allows ORM objects to be converted to this schema
-    class Config:
-        orm_mode = True
+    # Allows ORM objects to be converted to this schema; read-only once built
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # -----------------------------------------------
@@ -90,8 +95,15 @@ class UserCreate(UserBase):
     # Optional full name
     full_name: Optional[str] = None
 
-    # Simple text-based role to match the users.role column
+    # Name of a role from the roles catalog to assign (e.g., "admin", "staff")
     role: Optional[str] = "staff"
     
     # Optional list of role IDs used to assign one or more roles when creating a new user
     role_ids: list[int] | None = None
+
+    # Normalize the email once while the payload is parsed, so every route
+    # stores and compares the same trimmed, lowercase form.
+    @field_validator("email")
+    @classmethod
+    def _normalize_email(cls, value: str) -> str:
+        return normalize_email(value)
@@ -6,7 +6,7 @@ from dotenv import load_dotenv
 
 
 
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config
 from alembic import context
 
 # Import your SQLAlchemy Base so Alembic knows about your models
@@ -86,13 +86,14 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+    Builds an engine from alembic.ini's sqlalchemy.* options (with the
+    DATABASE_URL override above), so migrations only need DATABASE_URL and
+    not the full application settings. It uses SQLAlchemy's default pool
+    rather than NullPool; the engine is discarded when the run ends.
     """
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
     )
 
     with connectable.connect() as connection:
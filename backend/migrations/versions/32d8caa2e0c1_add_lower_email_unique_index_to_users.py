@@ -0,0 +1,64 @@
+"""add lower(email) unique index to users
+
+Existing databases may already hold emails that differ only by letter case
+(e.g. "Ann@x.com" and "ann@x.com"); the unique index can't be built over
+them. The upgrade checks for such rows first and stops with a list of them,
+leaving the duplicates for an operator to merge or rename by hand before
+running it again. Offline (--sql) runs skip the check.
+
+Revision ID: 32d8caa2e0c1
+Revises: cce98cfa8fa2
+Create Date: 2026-10-15 11:52:10.418233
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "32d8caa2e0c1"
+down_revision: Union[str, Sequence[str], None] = "cce98cfa8fa2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Enforce case-insensitive email uniqueness."""
+
+    # Fail with the conflicting rows instead of a bare unique-violation error.
+    if not context.is_offline_mode():
+        conflicts = op.get_bind().execute(
+            sa.text(
+                """
+                SELECT id, email FROM users
+                WHERE lower(email) IN (
+                    SELECT lower(email) FROM users
+                    GROUP BY lower(email) HAVING count(*) > 1
+                )
+                ORDER BY lower(email), id
+                """
+            )
+        ).all()
+        if conflicts:
+            rows = "\n".join(f"  id={row.id} email={row.email}" for row in conflicts)
+            raise RuntimeError(
+                "Cannot create ix_users_email_lower: these users have emails "
+                "that differ only by letter case. Merge or rename them, then "
+                f"re-run the migration.\n{rows}"
+            )
+
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the case-insensitive email index."""
+
+    op.drop_index("ix_users_email_lower", table_name="users")
@@ -0,0 +1,45 @@
+"""store listing bathrooms as float
+
+Revision ID: 5b0e7d4a9c21
+Revises: 32d8caa2e0c1
+Create Date: 2026-10-15 12:05:41.207316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0e7d4a9c21"
+down_revision: Union[str, Sequence[str], None] = "32d8caa2e0c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Change listings.bathrooms from NUMERIC(3, 1) to a float column."""
+
+    op.alter_column(
+        "listings",
+        "bathrooms",
+        existing_type=sa.Numeric(precision=3, scale=1),
+        type_=sa.Float(),
+        existing_nullable=False,
+        postgresql_using="bathrooms::double precision",
+    )
+
+
+def downgrade() -> None:
+    """Change listings.bathrooms back to NUMERIC(3, 1)."""
+
+    op.alter_column(
+        "listings",
+        "bathrooms",
+        existing_type=sa.Float(),
+        type_=sa.Numeric(precision=3, scale=1),
+        existing_nullable=False,
+        postgresql_using="bathrooms::numeric(3, 1)",
+    )
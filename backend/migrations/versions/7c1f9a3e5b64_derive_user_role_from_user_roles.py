@@ -0,0 +1,71 @@
+"""derive user role from user_roles
+
+Revision ID: 7c1f9a3e5b64
+Revises: d3a8b51f7e02
+Create Date: 2026-10-15 12:48:15.302671
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1f9a3e5b64"
+down_revision: Union[str, Sequence[str], None] = "d3a8b51f7e02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Move users.role into the roles / user_roles tables and drop the column."""
+
+    # Make sure the catalog has the built-in roles plus any role name in use.
+    op.execute(
+        """
+        INSERT INTO roles (name)
+        SELECT 'admin' UNION SELECT 'staff' UNION SELECT DISTINCT role FROM users
+        ON CONFLICT (name) DO NOTHING
+        """
+    )
+
+    # Link every user to the role stored in their role column.
+    op.execute(
+        """
+        INSERT INTO user_roles (user_id, role_id)
+        SELECT users.id, roles.id
+        FROM users JOIN roles ON roles.name = users.role
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+    op.drop_column("users", "role")
+
+
+def downgrade() -> None:
+    """Restore users.role from each user's assigned roles."""
+
+    op.add_column(
+        "users",
+        sa.Column("role", sa.String(), server_default="staff", nullable=False),
+    )
+
+    # Same precedence as User.role: admin, else the first role, else staff.
+    op.execute(
+        """
+        UPDATE users SET role = COALESCE(
+            (
+                SELECT roles.name
+                FROM roles JOIN user_roles ON user_roles.role_id = roles.id
+                WHERE user_roles.user_id = users.id
+                ORDER BY roles.name = 'admin' DESC, roles.id
+                LIMIT 1
+            ),
+            'staff'
+        )
+        """
+    )
+
+    op.alter_column("users", "role", server_default=None)
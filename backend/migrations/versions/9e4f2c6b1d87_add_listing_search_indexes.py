@@ -0,0 +1,41 @@
+"""add listing search indexes
+
+Revision ID: 9e4f2c6b1d87
+Revises: 5b0e7d4a9c21
+Create Date: 2026-10-15 12:21:08.553190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4f2c6b1d87"
+down_revision: Union[str, Sequence[str], None] = "5b0e7d4a9c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite indexes for location/price and room-count filters."""
+
+    op.create_index(
+        "ix_listings_city_state_price",
+        "listings",
+        ["city", "state", "price"],
+    )
+    op.create_index(
+        "ix_listings_bedrooms_bathrooms",
+        "listings",
+        ["bedrooms", "bathrooms"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the listing search indexes."""
+
+    op.drop_index("ix_listings_bedrooms_bathrooms", table_name="listings")
+    op.drop_index("ix_listings_city_state_price", table_name="listings")
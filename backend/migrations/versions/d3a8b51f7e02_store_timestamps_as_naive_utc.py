@@ -0,0 +1,58 @@
+"""store timestamps as naive utc
+
+Revision ID: d3a8b51f7e02
+Revises: 9e4f2c6b1d87
+Create Date: 2026-10-15 12:34:52.916804
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a8b51f7e02"
+down_revision: Union[str, Sequence[str], None] = "9e4f2c6b1d87"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Every timestamp column: (table, column, nullable)
+TIMESTAMP_COLUMNS = [
+    ("listings", "created_at", True),
+    ("listings", "updated_at", True),
+    ("roles", "created_at", False),
+    ("users", "created_at", True),
+]
+
+
+def upgrade() -> None:
+    """Convert timestamps to TIMESTAMP WITHOUT TIME ZONE holding UTC."""
+
+    for table, column, nullable in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.DateTime(timezone=False),
+            existing_nullable=nullable,
+            server_default=sa.text("timezone('utc', now())"),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    """Convert timestamps back to TIMESTAMP WITH TIME ZONE."""
+
+    for table, column, nullable in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(timezone=False),
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            server_default=sa.text("now()"),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+        )
@@ -59,8 +59,8 @@ export class ListingsComponent implements OnInit {
     this.listingService.getListings(this.currentPage, this.perPage).subscribe({
       next: (response) => {
         this.listings = response.items;
-        this.totalListings = response.total;
-        this.currentPage = response.page;
+        this.totalListings = response.total ?? this.totalListings;
+        this.currentPage = response.page ?? this.currentPage;
         this.perPage = response.per_page;
         this.isLoading = false;
       },
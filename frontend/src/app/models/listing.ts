@@ -22,9 +22,13 @@ export interface Listing {
 // Represents the paginated response returned by GET /listings
 export interface PaginatedListingsResponse {
   items: Listing[]; // Array of listing items for the current page
-  total: number; // Total number of listings across all pages
-  page: number; // Current page number
+  total: number | null; // Total number of listings across all pages; null when paging by after_id
+  page: number | null; // Current page number; null when paging by after_id
   per_page: number; // Number of items per page
+  // Last listing id on this page, sent as after_id for the next page.
+  // Requests that page by after_id get page: null and total: null, since page
+  // numbers don't apply and counting every listing would defeat the cursor.
+  next_cursor: number | null;
 }
 
 // Represents the data sent to POST /listings